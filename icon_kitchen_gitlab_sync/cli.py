@@ -1,31 +1,35 @@
 import argparse
+import errno
 import json
 import os
 import pathlib
+import re
 import shutil
 from typing import Any, Mapping, cast
 
 from colorama import Fore, Style, init as colorama_init
 
-from .codec import build_icon_kitchen_url, decode_url_fragment_to_json, encode_json_to_url_fragment
-from .downloader import download_many_and_extract_sync
+from .codec import build_icon_kitchen_urls, decode_url_fragment_to_json, loads_json
+from .downloader import DEFAULT_CONCURRENCY, download_many_and_extract_sync
 from .gitlab_uploader import upload_avatars_sync
 
+# Fragment after /i/, up to an optional query string or hash.
+_FRAGMENT_RE = re.compile(r"/i/([^?#]+)")
+
 
 def _load_json(path: pathlib.Path) -> dict[str, Any]:
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    # Parse the raw bytes directly, skipping the text-decoding layer.
+    return loads_json(path.read_bytes())
 
 
 def _extract_json_from_url(url: str) -> None:
     """Extract and print JSON configuration from an icon.kitchen URL."""
-    # Extract fragment from URL (part after /i/)
-    if "/i/" not in url:
-        raise SystemExit(f"Invalid icon.kitchen URL: expected '/i/' in URL: {url}")
-
-    fragment = url.split("/i/", 1)[1]
-    # Remove query string and fragment if present
-    fragment = fragment.split("?")[0].split("#")[0]
+    match = _FRAGMENT_RE.search(url)
+    if match is None:
+        raise SystemExit(
+            f"Invalid icon.kitchen URL: expected '/i/<fragment>' in URL: {url}"
+        )
+    fragment = match.group(1)
 
     try:
         decoded = decode_url_fragment_to_json(fragment)
@@ -34,25 +38,6 @@ def _extract_json_from_url(url: str) -> None:
         raise SystemExit(f"Failed to decode URL fragment: {exc}") from exc
 
 
-def _deep_merge(base: Mapping[str, Any], override: Mapping[str, Any]) -> dict[str, Any]:
-    """Recursively merge two mapping objects into a new dict.
-
-    Values from ``override`` take precedence over values from ``base``.
-    Nested dictionaries are merged recursively, everything else is replaced.
-    """
-    result: dict[str, Any] = dict(base)
-    for key, value in override.items():
-        if (
-            key in result
-            and isinstance(result[key], Mapping)
-            and isinstance(value, Mapping)
-        ):
-            result[key] = _deep_merge(result[key], cast(Mapping[str, Any], value))
-        else:
-            result[key] = value
-    return result
-
-
 def main(argv: list[str] | None = None) -> None:
     colorama_init(autoreset=True)
 
@@ -81,7 +66,7 @@ def main(argv: list[str] | None = None) -> None:
         "--download-dir",
         type=pathlib.Path,
         default=pathlib.Path("downloads"),
-        help="Directory for downloaded ZIP files (default: ./downloads).",
+        help="Base directory for download outputs (default: ./downloads).",
     )
     parser.add_argument(
         "--extract-dir",
@@ -89,6 +74,15 @@ def main(argv: list[str] | None = None) -> None:
         default=None,
         help="Directory to extract ZIP contents (default: <download-dir>/extracted).",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=(
+            "Number of archives downloaded in parallel "
+            f"(default: {DEFAULT_CONCURRENCY})."
+        ),
+    )
     parser.add_argument(
         "--sub-extract",
         type=str,
@@ -117,6 +111,9 @@ def main(argv: list[str] | None = None) -> None:
     if args.input is None:
         raise SystemExit("Either 'input' path or '--extract-json URL' must be provided.")
 
+    if args.concurrency < 1:
+        raise SystemExit("--concurrency must be at least 1.")
+
     if args.gitlab_uploader and not args.sub_extract:
         raise SystemExit(
             "--gitlab-uploader can only be used together with --sub-extract."
@@ -162,6 +159,11 @@ def main(argv: list[str] | None = None) -> None:
             )
 
         name = raw_name.strip()
+        if name in item_names:
+            raise SystemExit(
+                f"items[{idx}] has duplicate name '{name}'; item names must be unique."
+            )
+
         overrides_dict: dict[str, Any] = {
             key: value for key, value in item.items() if key != "name"
         }
@@ -172,16 +174,10 @@ def main(argv: list[str] | None = None) -> None:
         item_names.append(name)
         item_overrides.append(overrides_dict)
 
-    urls: list[str] = []
-
     print(Fore.CYAN + "Icon.kitchen URLs:")
 
-    for index, overrides in enumerate(item_overrides):
-        merged = _deep_merge(template, overrides)
-        fragment = encode_json_to_url_fragment(merged)
-        url = build_icon_kitchen_url(fragment)
-        urls.append(url)
-
+    urls = build_icon_kitchen_urls(template, item_overrides)
+    for index, url in enumerate(urls):
         print(f"{Fore.YELLOW}[{index}]{Style.RESET_ALL} {url}")
 
     if args.download:
@@ -198,6 +194,7 @@ def main(argv: list[str] | None = None) -> None:
             download_dir=args.download_dir,
             extract_dir=args.extract_dir,
             names=item_names,
+            concurrency=args.concurrency,
         )
         for index, path in enumerate(extracted_dirs):
             print(f"{Fore.GREEN}[{index}] ZIP downloaded and extracted to: {path}")
@@ -261,6 +258,21 @@ def _maybe_cleanup_previous_outputs(
         print(Fore.GREEN + f"Removed {p}")
 
 
+# Errors meaning "hard links are not possible here", handled by copying instead.
+_LINK_FALLBACK_ERRNOS = {errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP}
+
+
+def _link_or_copy(source_path: pathlib.Path, target_path: pathlib.Path) -> None:
+    """Hard-link ``source_path`` to ``target_path``, copying if linking fails."""
+    target_path.unlink(missing_ok=True)
+    try:
+        os.link(source_path, target_path)
+    except OSError as exc:
+        if exc.errno not in _LINK_FALLBACK_ERRNOS:
+            raise
+        shutil.copy2(source_path, target_path)
+
+
 def _perform_sub_extract(
     extracted_dirs: list[pathlib.Path],
     item_names: list[str],
@@ -284,7 +296,7 @@ def _perform_sub_extract(
             continue
 
         target_path = sub_dir / f"{name}{source_path.suffix}"
-        shutil.copy2(source_path, target_path)
+        _link_or_copy(source_path, target_path)
         print(
             f"{Fore.GREEN}[{index}] Collected '{relative_path}' "
             f"from '{name}' to {target_path}"
@@ -303,15 +315,22 @@ def _perform_gitlab_upload(
     sub_dir = download_dir / "sub_extracted"
     suffix = pathlib.Path(relative_path).suffix
 
+    # One directory scan instead of a stat() per item.
+    present: dict[str, pathlib.Path] = {}
+    if sub_dir.is_dir():
+        with os.scandir(sub_dir) as entries:
+            present = {e.name: pathlib.Path(e.path) for e in entries if e.is_file()}
+
     avatars: dict[str, pathlib.Path] = {}
     print(Fore.CYAN + "\nUploading collected icons to GitLab projects...")
 
     for name in item_names:
-        avatar_path = sub_dir / f"{name}{suffix}"
-        if not avatar_path.is_file():
+        avatar_path = present.get(f"{name}{suffix}")
+        if avatar_path is None:
             print(
                 Fore.YELLOW
-                + f"[gitlab] Skipping '{name}': avatar file not found at {avatar_path}"
+                + f"[gitlab] Skipping '{name}': avatar file not found at "
+                f"{sub_dir / f'{name}{suffix}'}"
             )
             continue
         avatars[name] = avatar_path
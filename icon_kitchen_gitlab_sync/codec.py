@@ -1,22 +1,46 @@
 import base64
 import gzip
 import json
-from typing import Any, Dict
+import zlib
+from typing import Any, Dict, Iterable, Mapping, cast
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# Shared compact encoder: avoids building a new JSONEncoder on every dumps() call.
+_json_encode = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to compact UTF-8 JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return _json_encode(obj).encode("utf-8")
+
+
+def loads_json(data: bytes) -> Any:
+    """Parse UTF-8 JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+ICON_KITCHEN_URL_PREFIX = "https://icon.kitchen/i/"
+
+# wbits=16+15 makes zlib emit a gzip container itself (header, CRC32, trailer).
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
 
 
 def _base64_to_base64url(data: bytes) -> str:
     """bytes -> url-safe base64 string without padding."""
-    b64 = base64.b64encode(data).decode("ascii")
-    return b64.replace("+", "-").replace("/", "_").rstrip("=")
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
 
 
 def _base64url_to_bytes(s: str) -> bytes:
     """url-safe base64 string (no padding) -> bytes."""
-    s = s.replace("-", "+").replace("_", "/")
-    # restore padding
-    while len(s) % 4:
-        s += "="
-    return base64.b64decode(s)
+    return base64.urlsafe_b64decode(s + "=" * (-len(s) % 4))
 
 
 def encode_json_to_url_fragment(obj: Any) -> str:
@@ -24,19 +48,54 @@ def encode_json_to_url_fragment(obj: Any) -> str:
 
     The result can be appended to `https://icon.kitchen/i/`.
     """
-    json_str = obj if isinstance(obj, str) else json.dumps(obj, separators=(",", ":"))
-    compressed = gzip.compress(json_str.encode("utf-8"))
+    json_bytes = obj.encode("utf-8") if isinstance(obj, str) else _dumps(obj)
+    compressed = zlib.compress(json_bytes, level=9, wbits=_GZIP_WBITS)
     return _base64_to_base64url(compressed)
 
 
 def decode_url_fragment_to_json(fragment: str) -> Dict[str, Any]:
     """Decode a base64url+gzip fragment from `/i/<...>` back to a JSON dict."""
     raw = _base64url_to_bytes(fragment)
-    decompressed = gzip.decompress(raw).decode("utf-8")
-    return json.loads(decompressed)
+    return loads_json(gzip.decompress(raw))
 
 
 def build_icon_kitchen_url(fragment: str) -> str:
     """Build a full icon.kitchen URL from a fragment."""
-    return f"https://icon.kitchen/i/{fragment}"
+    return f"{ICON_KITCHEN_URL_PREFIX}{fragment}"
+
+
+def deep_merge(base: Mapping[str, Any], override: Mapping[str, Any]) -> dict[str, Any]:
+    """Merge two mapping objects into a new dict.
+
+    Values from ``override`` take precedence over values from ``base``.
+    Nested dictionaries are merged, everything else is replaced. Only the
+    branches touched by ``override`` are copied; untouched subtrees are shared
+    with ``base``.
+    """
+    result: dict[str, Any] = dict(base)
+    stack: list[tuple[dict[str, Any], Mapping[str, Any]]] = [(result, override)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            current = dst.get(key)
+            if isinstance(current, Mapping) and isinstance(value, Mapping):
+                merged: dict[str, Any] = dict(cast(Mapping[str, Any], current))
+                dst[key] = merged
+                stack.append((merged, cast(Mapping[str, Any], value)))
+            else:
+                dst[key] = value
+    return result
+
 
+def build_icon_kitchen_urls(
+    template: Mapping[str, Any], overrides_list: Iterable[Mapping[str, Any]]
+) -> list[str]:
+    """Merge each override into ``template`` and build its icon.kitchen URL.
+
+    Equivalent to ``build_icon_kitchen_url(encode_json_to_url_fragment(...))``
+    per item, with the helpers bound to locals for the batch loop.
+    """
+    merge = deep_merge
+    encode = encode_json_to_url_fragment
+    prefix = ICON_KITCHEN_URL_PREFIX
+    return [prefix + encode(merge(template, overrides)) for overrides in overrides_list]
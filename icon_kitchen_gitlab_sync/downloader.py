@@ -1,14 +1,56 @@
 from __future__ import annotations
 
 import asyncio
+import io
 import pathlib
 import zipfile
 from typing import Optional
 
-from playwright.async_api import async_playwright
+from playwright.async_api import Page, async_playwright
 
 
 DOWNLOAD_BUTTON_SELECTOR = 'button[aria-label="Download"]'
+DEFAULT_CONCURRENCY = 4
+DOWNLOAD_BUTTON_TIMEOUT_MS = 15_000
+
+
+def _extract_zip_bytes(data: bytes, target_dir: pathlib.Path) -> None:
+    with zipfile.ZipFile(io.BytesIO(data), "r") as zf:
+        zf.extractall(target_dir)
+
+
+async def _download_and_extract_one(
+    pages: asyncio.Queue[Page],
+    url: str,
+    target_dir: pathlib.Path,
+) -> pathlib.Path:
+    page = await pages.get()
+    try:
+        # icon.kitchen keeps the network busy, so waiting for "networkidle"
+        # only adds delay; the Download button is what we actually need.
+        await page.goto(url, wait_until="domcontentloaded")
+        await page.wait_for_selector(
+            DOWNLOAD_BUTTON_SELECTOR,
+            state="visible",
+            timeout=DOWNLOAD_BUTTON_TIMEOUT_MS,
+        )
+
+        async with page.expect_download() as download_info:
+            await page.click(DOWNLOAD_BUTTON_SELECTOR)
+
+        download = await download_info.value
+        # Read Playwright's temporary copy instead of saving a second one, then
+        # drop it right away since pooled contexts outlive this download.
+        zip_path = await download.path()
+        data = await asyncio.to_thread(zip_path.read_bytes)
+        await download.delete()
+    finally:
+        pages.put_nowait(page)
+
+    target_dir.mkdir(parents=True, exist_ok=True)
+    await asyncio.to_thread(_extract_zip_bytes, data, target_dir)
+
+    return target_dir
 
 
 async def download_many_and_extract(
@@ -16,57 +58,52 @@ async def download_many_and_extract(
     download_dir: pathlib.Path,
     extract_dir: Optional[pathlib.Path] = None,
     names: Optional[list[str]] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
 ) -> list[pathlib.Path]:
     """Download and extract multiple ZIPs using a single browser instance.
 
-    Each URL will be opened, its ZIP downloaded into ``download_dir``, extracted into
-    ``extract_dir/<name>`` (or ``extract_dir/item_<index>`` if names are not provided),
-    and then the ZIP file will be removed.
+    Up to ``concurrency`` URLs are processed at once on a pool of pages, each
+    in its own browser context that is reused across URLs. Every ZIP is read
+    from the browser's temporary download and extracted in memory into
+    ``extract_dir/<name>`` (or ``extract_dir/item_<index>`` if names are not
+    provided); no ZIP is written to ``download_dir``, which only hosts the
+    default ``extracted`` folder. The result keeps the order of ``urls``.
     """
     if names is not None and len(names) != len(urls):
         raise ValueError("Length of 'names' must match length of 'urls'.")
+    if concurrency < 1:
+        raise ValueError("'concurrency' must be at least 1.")
 
-    download_dir.mkdir(parents=True, exist_ok=True)
     base_extract_dir = extract_dir or (download_dir / "extracted")
     base_extract_dir.mkdir(parents=True, exist_ok=True)
 
-    extracted_dirs: list[pathlib.Path] = []
-
     async with async_playwright() as p:
         browser = await p.chromium.launch(
             channel="chromium-headless-shell", headless=True
         )
-        context = await browser.new_context(accept_downloads=True)
-        page = await context.new_page()
-
-        for index, url in enumerate(urls):
-            await page.goto(url, wait_until="networkidle")
-
-            async with page.expect_download() as download_info:
-                await page.click(DOWNLOAD_BUTTON_SELECTOR)
-
-            download = await download_info.value
-            filename = download.suggested_filename or f"icon-kitchen-{index}.zip"
-            zip_path = download_dir / filename
-            await download.save_as(str(zip_path))
-
-            folder_name = names[index] if names is not None else f"item_{index}"
-            target_dir = base_extract_dir / folder_name
-            target_dir.mkdir(parents=True, exist_ok=True)
-            with zipfile.ZipFile(zip_path, "r") as zf:
-                zf.extractall(target_dir)
-
-            try:
-                zip_path.unlink()
-            except OSError:
-                pass
-
-            extracted_dirs.append(target_dir)
-
-        await context.close()
-        await browser.close()
-
-    return extracted_dirs
+        try:
+            pages: asyncio.Queue[Page] = asyncio.Queue()
+            for _ in range(min(concurrency, len(urls))):
+                context = await browser.new_context(accept_downloads=True)
+                pages.put_nowait(await context.new_page())
+
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(
+                        _download_and_extract_one(
+                            pages,
+                            url,
+                            base_extract_dir
+                            / (names[index] if names is not None else f"item_{index}"),
+                        )
+                    )
+                    for index, url in enumerate(urls)
+                ]
+        finally:
+            # Closing the browser also closes every pooled context.
+            await browser.close()
+
+    return [task.result() for task in tasks]
 
 
 def download_many_and_extract_sync(
@@ -74,6 +111,9 @@ def download_many_and_extract_sync(
     download_dir: pathlib.Path,
     extract_dir: Optional[pathlib.Path] = None,
     names: Optional[list[str]] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
 ) -> list[pathlib.Path]:
     """Synchronous wrapper around ``download_many_and_extract``."""
-    return asyncio.run(download_many_and_extract(urls, download_dir, extract_dir, names))
+    return asyncio.run(
+        download_many_and_extract(urls, download_dir, extract_dir, names, concurrency)
+    )
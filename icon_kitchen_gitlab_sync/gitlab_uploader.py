@@ -12,6 +12,41 @@ import io
 from PIL import Image
 
 MAX_AVATAR_SIZE = 200 * 1024  # 200 KB
+# GitLab renders avatars far below this, so larger sources are shrunk up-front.
+MAX_AVATAR_DIMENSION = 512
+JPEG_MIN_QUALITY = 10
+JPEG_MAX_QUALITY = 95
+UPLOAD_CONCURRENCY = 8
+PROJECTS_PER_PAGE = 100  # GitLab maximum
+
+
+def _encode_image(
+    img: Image.Image, output_format: str, params: dict[str, Any]
+) -> io.BytesIO:
+    buffer = io.BytesIO()
+    img.save(buffer, format=output_format, **params)
+    return buffer
+
+
+def _search_jpeg_quality(img: Image.Image, max_size: int) -> io.BytesIO:
+    """Return the highest-quality JPEG encoding of ``img`` that fits ``max_size``.
+
+    Qualities are bisected, so at most ~7 encodes are needed. If nothing fits,
+    the encoding at ``JPEG_MIN_QUALITY`` is returned.
+    """
+    lo, hi = JPEG_MIN_QUALITY, JPEG_MAX_QUALITY
+    quality = hi
+    best: io.BytesIO | None = None
+    buffer = io.BytesIO()
+    while lo <= hi:
+        buffer = _encode_image(img, "JPEG", {"optimize": True, "quality": quality})
+        if buffer.tell() <= max_size:
+            best = buffer
+            lo = quality + 1
+        else:
+            hi = quality - 1
+        quality = (lo + hi) // 2
+    return best if best is not None else buffer
 
 
 def compress_image_to_size(
@@ -19,100 +54,130 @@ def compress_image_to_size(
 ) -> tuple[io.BytesIO, str]:
     """
     Open image from path, compress to <= max_size bytes, return (BytesIO, content_type).
-    If image is already small enough, returns original (or converted if PNG and user requests JPEG).
+    Files already within the limit are returned unchanged without decoding.
+    JPEG quality is bisected; PNG has no quality knob and is only resized if needed.
     Always outputs PNG or JPEG depending on file extension.
     """
-    img = Image.open(path)
     ext = path.suffix.lower()
-    output_format = "PNG"
-    content_type = "image/png"
-    params: dict[str, Any] = {}
+    # Already within the limit and in an accepted format: upload the file as-is.
+    if ext in {".png", ".jpg", ".jpeg"} and path.stat().st_size <= max_size:
+        content_type = "image/png" if ext == ".png" else "image/jpeg"
+        return io.BytesIO(path.read_bytes()), content_type
+
+    img = Image.open(path)
+    # In-place and a no-op for images that are already small enough; for JPEG
+    # sources it also draft-decodes at a reduced DCT scale before resampling.
+    img.thumbnail(
+        (MAX_AVATAR_DIMENSION, MAX_AVATAR_DIMENSION), Image.Resampling.LANCZOS
+    )
     # If extension indicates JPEG, prefer JPEG
     if ext in {".jpg", ".jpeg"}:
-        img = img.convert("RGB")
+        if img.mode not in {"RGB", "L"}:
+            img = img.convert("RGB")
         output_format = "JPEG"
         content_type = "image/jpeg"
-        params = {"optimize": True, "quality": 85}
+        params: dict[str, Any] = {"optimize": True, "quality": JPEG_MIN_QUALITY}
+        buffer = _search_jpeg_quality(img, max_size)
     else:
-        # Optimize PNG, let Pillow choose best parameters
+        # Optimize PNG, let Pillow choose best parameters; alpha is kept as-is
+        output_format = "PNG"
+        content_type = "image/png"
         params = {"optimize": True}
-
-    # Start at best quality, decrease if needed
-    step_quality = [100, 95, 90, 85, 80, 70, 60, 50, 40, 30, 10]
-    save_kwargs: dict[str, Any] = {}
-    buffer = io.BytesIO()
-    for q in step_quality:
-        buffer.seek(0)
-        buffer.truncate(0)
-        save_kwargs = params.copy()
-        if output_format == "JPEG":
-            save_kwargs["quality"] = q
-        img.save(buffer, format=output_format, **save_kwargs)
-        if buffer.tell() <= max_size:
-            break
-    else:
-        # last-ditch: try to resize if still too large
-        width, height = img.size
-        while buffer.tell() > max_size and width > 128 and height > 128:
-            width = int(width * 0.9)
-            height = int(height * 0.9)
-            img_resized = img.resize((width, height), resample=Image.Resampling.LANCZOS)  # type: ignore
-            buffer.seek(0)
-            buffer.truncate(0)
-            img_resized.save(buffer, format=output_format, **save_kwargs)
-            if buffer.tell() <= max_size:
-                break
-        # Fallback: if still too big, just use the current result (could still be oversized)
+        buffer = _encode_image(img, output_format, params)
+
+    # last-ditch: try to resize if still too large
+    width, height = img.size
+    while buffer.tell() > max_size and width > 128 and height > 128:
+        width = int(width * 0.9)
+        height = int(height * 0.9)
+        img_resized = img.resize((width, height), resample=Image.Resampling.LANCZOS)  # type: ignore
+        buffer = _encode_image(img_resized, output_format, params)
+    # Fallback: if still too big, just use the current result (could still be oversized)
     buffer.seek(0)
     return buffer, content_type
 
 
-async def _find_project_id(
+async def _fetch_projects_page(
     session: ClientSession,
-    project_name: str,
-) -> int | None:
-    """Return the project id that matches ``project_name``.
-
-    If multiple projects share this name, the user is asked to choose one.
-    """
+    page: int,
+) -> tuple[list[dict[str, Any]], Mapping[str, str]]:
+    """Fetch one page of the user's member projects and the response headers."""
     params = {
-        "search": project_name,
-        "simple": "true",
         "membership": "true",
+        "simple": "true",
+        "per_page": str(PROJECTS_PER_PAGE),
+        "page": str(page),
     }
 
-    try:
-        async with session.get("/api/v4/projects", params=params) as resp:
-            resp.raise_for_status()
-
-            try:
-                data = await resp.json()
-            except Exception as exc:
-                print(
-                    Fore.RED
-                    + f"[gitlab] Invalid JSON while searching for '{project_name}': {exc}"
-                )
-                return None
+    async with session.get("/api/v4/projects", params=params) as resp:
+        resp.raise_for_status()
+        data = await resp.json()
+        if not isinstance(data, list):
+            raise ValueError(f"expected list, got {type(data).__name__}")
+        return cast("list[dict[str, Any]]", data), resp.headers
+
+
+async def _prefetch_projects(
+    session: ClientSession,
+) -> dict[str, list[dict[str, Any]]] | None:
+    """Return the user's member projects grouped by name, or ``None`` on failure.
 
-            if not isinstance(data, list):
-                print(
-                    Fore.RED
-                    + f"[gitlab] Unexpected JSON payload while searching for '{project_name}': "
-                    f"expected list, got {type(data).__name__}"
+    The first page reports the page count, the remaining pages are then fetched
+    concurrently. GitLab omits ``X-Total-Pages`` for very large result sets, in
+    which case ``X-Next-Page`` is followed instead.
+    """
+    projects: list[dict[str, Any]] = []
+    error: str | None = None
+    try:
+        projects, headers = await _fetch_projects_page(session, 1)
+        total_pages = headers.get("X-Total-Pages", "")
+        if total_pages.isdigit():
+            # A failing page cancels the others before the session closes.
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(_fetch_projects_page(session, page))
+                    for page in range(2, int(total_pages) + 1)
+                ]
+            for task in tasks:
+                projects.extend(task.result()[0])
+        else:
+            next_page = headers.get("X-Next-Page", "")
+            while next_page.isdigit():
+                page_projects, headers = await _fetch_projects_page(
+                    session, int(next_page)
                 )
-                return None
-            data = cast("list[dict[str, Any]]", data)
-    except ClientResponseError as exc:
-        print(
-            Fore.RED + f"[gitlab] Failed to search project '{project_name}': "
-            f"HTTP {exc.status} - {exc.message}"
-        )
+                projects.extend(page_projects)
+                next_page = headers.get("X-Next-Page", "")
+    except* aiohttp.ContentTypeError as group:
+        error = f"Invalid JSON while listing projects: {group.exceptions[0]}"
+    except* ClientResponseError as group:
+        exc = cast(ClientResponseError, group.exceptions[0])
+        error = f"Failed to list projects: HTTP {exc.status} - {exc.message}"
+    except* ValueError as group:
+        error = f"Unexpected JSON payload while listing projects: {group.exceptions[0]}"
+
+    if error is not None:
+        print(Fore.RED + f"[gitlab] {error}")
         return None
 
-    exact_matches: list[dict[str, object]] = []
-    for proj in data:
-        if proj.get("name") == project_name:
-            exact_matches.append(proj)
+    by_name: dict[str, list[dict[str, Any]]] = {}
+    for proj in projects:
+        name = proj.get("name")
+        if isinstance(name, str):
+            by_name.setdefault(name, []).append(proj)
+    return by_name
+
+
+def _find_project_id(
+    projects: Mapping[str, list[dict[str, Any]]],
+    project_name: str,
+) -> int | None:
+    """Return the project id that matches ``project_name``.
+
+    ``projects`` is the name index built by ``_prefetch_projects``.
+    If multiple projects share this name, the user is asked to choose one.
+    """
+    exact_matches = projects.get(project_name, [])
 
     if not exact_matches:
         print(
@@ -131,6 +196,13 @@ async def _find_project_id(
         )
         return None
 
+    return _prompt_project_choice(project_name, exact_matches)
+
+
+def _prompt_project_choice(
+    project_name: str,
+    exact_matches: list[dict[str, Any]],
+) -> int | None:
     print(Fore.YELLOW + f"[gitlab] Multiple projects found for name '{project_name}':")
     for idx, proj in enumerate(exact_matches):
         pid = proj.get("id")
@@ -172,24 +244,18 @@ async def _find_project_id(
 
 async def _upload_single_avatar(
     session: ClientSession,
+    proj_id: int,
     project_name: str,
     avatar_path: pathlib.Path,
 ) -> None:
-    proj_id = await _find_project_id(session, project_name)
-    if proj_id is None:
-        return
-
-    if not avatar_path.is_file():
-        print(
-            Fore.RED
-            + f"[gitlab] Avatar file for '{project_name}' not found: {avatar_path}"
-        )
-        return
-
     # --- Compress image to fit size limit ---
     try:
-        buffer, content_type = compress_image_to_size(avatar_path, MAX_AVATAR_SIZE)
-        buffer_len = buffer.getbuffer().nbytes
+        buffer, content_type = await asyncio.to_thread(
+            compress_image_to_size, avatar_path, MAX_AVATAR_SIZE
+        )
+        # Zero-copy view; aiohttp wraps it without a seek/read copy of the buffer.
+        payload = buffer.getbuffer()
+        buffer_len = payload.nbytes
         if buffer_len > MAX_AVATAR_SIZE:
             print(
                 Fore.YELLOW
@@ -204,7 +270,7 @@ async def _upload_single_avatar(
     form = aiohttp.FormData()
     form.add_field(
         "avatar",
-        buffer,
+        payload,
         filename=avatar_path.name,
         content_type=content_type,
     )
@@ -235,13 +301,38 @@ async def _upload_avatars(
     timeout = aiohttp.ClientTimeout(total=60)
     base = base_url.rstrip("/")
 
+    connector = aiohttp.TCPConnector(
+        limit=2 * UPLOAD_CONCURRENCY,
+        limit_per_host=UPLOAD_CONCURRENCY,
+        ttl_dns_cache=300,
+    )
+    semaphore = asyncio.Semaphore(UPLOAD_CONCURRENCY)
+
+    async def _bounded_upload(proj_id: int, name: str, path: pathlib.Path) -> None:
+        async with semaphore:
+            await _upload_single_avatar(session, proj_id, name, path)
+
     async with aiohttp.ClientSession(
         base_url=base,
         timeout=timeout,
         headers={"PRIVATE-TOKEN": token},
+        connector=connector,
     ) as session:
+        projects = await _prefetch_projects(session)
+        if projects is None:
+            return
+
+        # Resolve every project (prompting where needed) before any upload
+        # starts, so prompts are never interleaved with upload output.
+        targets: list[tuple[int, str, pathlib.Path]] = []
         for name, path in avatars.items():
-            await _upload_single_avatar(session, name, path)
+            proj_id = _find_project_id(projects, name)
+            if proj_id is not None:
+                targets.append((proj_id, name, path))
+
+        async with asyncio.TaskGroup() as tg:
+            for proj_id, name, path in targets:
+                tg.create_task(_bounded_upload(proj_id, name, path))
 
 
 def upload_avatars_sync(